@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import argparse
 import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
 
 DEFAULT_BASE_URL = "http://127.0.0.1:8080"
 DEFAULT_TIMEOUT_SECONDS = 30
@@ -27,7 +30,7 @@ def env_timeout() -> int:
 
 
 def add_mcp_arguments(
-    parser: argparse.ArgumentParser,
+    parser: "argparse.ArgumentParser",
     *,
     default_base_url: str,
     default_timeout: int,
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-import argparse
-from typing import Sequence
+import sys
+from typing import TYPE_CHECKING, Sequence
 
-from ._mcp_args import DEFAULT_TIMEOUT_SECONDS, add_mcp_arguments, env_base_url
+from ._mcp_args import add_mcp_arguments, env_base_url, env_timeout
+
+if TYPE_CHECKING:
+    import argparse
+
+_TRANSPORTS = ("stdio", "streamable-http")
 
 
 def _run_mcp(*, transport: str, base_url: str, timeout: int) -> None:
@@ -14,7 +19,104 @@ def _run_mcp(*, transport: str, base_url: str, timeout: int) -> None:
     serve_mcp(transport=transport, base_url=base_url, timeout=timeout)
 
 
-def build_parser() -> argparse.ArgumentParser:
+def _run_mcp_supervisor(*, socket_path: str, base_url: str, timeout: int) -> None:
+    """Serve stdio MCP sessions from one warm interpreter.
+
+    Listens on a UNIX socket; each accepted connection is handled by a
+    forked child whose stdin/stdout are the connection, inheriting the
+    preloaded FastMCP instance copy-on-write. Amortizes the pydantic/httpx
+    import and tool registration across sessions.
+    """
+    import os
+    import signal
+    import socket
+
+    if not hasattr(os, "fork"):
+        raise SystemExit("mcp-supervisor requires a POSIX platform")
+
+    from .mcp.server import create_server
+
+    mcp = create_server(base_url=base_url, timeout=timeout)
+
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen()
+    # Children exit on their own; let the kernel reap them.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    try:
+        while True:
+            conn, _ = listener.accept()
+            pid = os.fork()
+            if pid == 0:
+                listener.close()
+                fd = conn.fileno()
+                os.dup2(fd, 0)
+                os.dup2(fd, 1)
+                conn.close()
+                try:
+                    mcp.run(transport="stdio")
+                finally:
+                    os._exit(0)
+            conn.close()
+    finally:
+        listener.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+
+
+def _parse_mcp_fast(argv: Sequence[str]) -> dict[str, object] | None:
+    """Parse `agentland mcp` flags without argparse.
+
+    Returns None when the arguments need argparse (help or anything this
+    fast path does not recognize), so error reporting stays unchanged.
+    """
+    opts: dict[str, object] = {
+        "transport": "stdio",
+        "base_url": env_base_url(),
+        "timeout": env_timeout(),
+    }
+    tokens = list(argv)
+    i = 0
+    while i < len(tokens):
+        name, sep, value = tokens[i].partition("=")
+        if name not in ("--transport", "--base-url", "--timeout"):
+            return None
+        if not sep:
+            i += 1
+            if i >= len(tokens):
+                return None
+            value = tokens[i]
+        if name == "--transport":
+            if value not in _TRANSPORTS:
+                return None
+            opts["transport"] = value
+        elif name == "--base-url":
+            opts["base_url"] = value
+        else:
+            try:
+                opts["timeout"] = int(value)
+            except ValueError:
+                return None
+        i += 1
+    return opts
+
+
+_PARSER: "argparse.ArgumentParser | None" = None
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    # Lazy singleton: argparse import and parser wiring happen at most once
+    # per interpreter, even across repeated main() calls.
+    global _PARSER
+    if _PARSER is not None:
+        return _PARSER
+
+    import argparse
+
     parser = argparse.ArgumentParser(prog="agentland", description="Agentland CLI")
     subparsers = parser.add_subparsers(dest="command")
 
@@ -22,16 +124,67 @@ def build_parser() -> argparse.ArgumentParser:
     add_mcp_arguments(
         mcp_parser,
         default_base_url=env_base_url(),
-        default_timeout=DEFAULT_TIMEOUT_SECONDS,
+        default_timeout=env_timeout(),
     )
+
+    sup_parser = subparsers.add_parser(
+        "mcp-supervisor",
+        help="Run a prefork MCP supervisor on a UNIX socket",
+    )
+    sup_parser.add_argument(
+        "--socket",
+        required=True,
+        help="UNIX socket path to listen on.",
+    )
+    sup_parser.add_argument(
+        "--base-url",
+        default=env_base_url(),
+        help="Gateway base URL.",
+    )
+    sup_parser.add_argument(
+        "--timeout",
+        type=int,
+        default=env_timeout(),
+        help="HTTP request timeout in seconds.",
+    )
+    _PARSER = parser
     return parser
 
 
+def _prewarm_mcp_import() -> None:
+    from threading import Thread
+
+    def _import() -> None:
+        try:
+            from .mcp.server import _require_fastmcp
+
+            _require_fastmcp()
+        except Exception:
+            # The real import path will surface the error with context.
+            pass
+
+    Thread(target=_import, daemon=True).start()
+
+
 def main(argv: Sequence[str] | None = None) -> int:
+    tokens = list(sys.argv[1:] if argv is None else argv)
+    if tokens[:1] == ["mcp"]:
+        opts = _parse_mcp_fast(tokens[1:])
+        if opts is not None:
+            _prewarm_mcp_import()
+            _run_mcp(
+                transport=str(opts["transport"]),
+                base_url=str(opts["base_url"]),
+                timeout=int(opts["timeout"]),  # type: ignore[call-overload]
+            )
+            return 0
+
     parser = build_parser()
-    args = parser.parse_args(argv)
+    args = parser.parse_args(tokens)
 
     if args.command == "mcp":
+        # Overlap the heavyweight MCP import with the remaining setup.
+        _prewarm_mcp_import()
         _run_mcp(
             transport=args.transport,
             base_url=args.base_url,
@@ -39,6 +192,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 0
 
+    if args.command == "mcp-supervisor":
+        _run_mcp_supervisor(
+            socket_path=args.socket,
+            base_url=args.base_url,
+            timeout=args.timeout,
+        )
+        return 0
+
     parser.print_help()
     return 0
 
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
-import argparse
+import sys
 from typing import Sequence
 
-from .._mcp_args import add_mcp_arguments, env_base_url, env_timeout
 from .server import create_server
 
 
@@ -17,24 +16,11 @@ def serve_mcp(*, transport: str, base_url: str, timeout: int) -> None:
     mcp.run(transport="stdio")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Agentland MCP server")
-    add_mcp_arguments(
-        parser,
-        default_base_url=env_base_url(),
-        default_timeout=env_timeout(),
-    )
-    return parser
-
-
 def main(argv: Sequence[str] | None = None) -> int:
-    args = build_parser().parse_args(argv)
-    serve_mcp(
-        transport=args.transport,
-        base_url=args.base_url,
-        timeout=args.timeout,
-    )
-    return 0
+    # Argument handling lives in cli so the flag surface is defined once.
+    from ..cli import main as cli_main
+
+    return cli_main(["mcp", *(sys.argv[1:] if argv is None else list(argv))])
 
 
 if __name__ == "__main__":
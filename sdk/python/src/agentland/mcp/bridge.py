@@ -2,21 +2,58 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
-from threading import Thread
+from threading import Lock
 from typing import Any
 
-from agentland.sandbox import SDKError, Sandbox
+from agentland.sandbox import AsyncSandbox, SDKError
+
+_SANDBOX_CACHE_MAX = 256
+
+# Keep strong references to fire-and-forget cleanup tasks so the event loop
+# does not garbage-collect them mid-flight.
+_CLEANUP_TASKS: set[asyncio.Task] = set()
+
+# Pre-resolved spellings for the common language values so the hot path
+# skips strip()/lower() string allocations.
+_LANGUAGE_TABLE = {
+    None: "python",
+    "": "python",
+    "python": "python",
+    "Python": "python",
+    "bash": "bash",
+    "Bash": "bash",
+}
 
 
 class CodeInterpreterToolBridge:
     """Implements MCP tool semantics on top of the Python SDK."""
 
+    __slots__ = ("_sandbox_cache", "_cache_lock")
+
     def __init__(self, *, base_url: str, timeout: int = 30) -> None:
-        Sandbox.configure(base_url=base_url, timeout=timeout)
+        AsyncSandbox.configure(base_url=base_url, timeout=timeout)
+        self._sandbox_cache: dict[str, AsyncSandbox] = {}
+        self._cache_lock = Lock()
+
+    def _get_sandbox(self, sandbox_id: str) -> AsyncSandbox:
+        with self._cache_lock:
+            sandbox = self._sandbox_cache.get(sandbox_id)
+            if sandbox is None:
+                sandbox = AsyncSandbox.connect(sandbox_id)
+                if len(self._sandbox_cache) >= _SANDBOX_CACHE_MAX:
+                    self._sandbox_cache.pop(next(iter(self._sandbox_cache)))
+                self._sandbox_cache[sandbox_id] = sandbox
+            return sandbox
 
     @staticmethod
     def _require_sandbox_id(sandbox_id: str) -> str:
+        if not sandbox_id:
+            raise ValueError("sandbox_id is required")
+        # Most callers pass an already-clean id; avoid allocating a copy.
+        if not sandbox_id[0].isspace() and not sandbox_id[-1].isspace():
+            return sandbox_id
         sid = sandbox_id.strip()
         if not sid:
             raise ValueError("sandbox_id is required")
@@ -24,16 +61,19 @@ class CodeInterpreterToolBridge:
 
     @staticmethod
     def _normalize_language(language: str | None) -> str:
+        cached = _LANGUAGE_TABLE.get(language)
+        if cached is not None:
+            return cached
         normalized = (language or "").strip().lower()
         if not normalized:
             return "python"
         return normalized
 
-    def sandbox_create(self) -> dict[str, Any]:
-        sandbox = Sandbox.create()
+    async def sandbox_create(self) -> dict[str, Any]:
+        sandbox = await AsyncSandbox.create()
         return {"sandbox_id": sandbox.sandbox_id}
 
-    def code_execute(
+    async def code_execute(
         self,
         *,
         sandbox_id: str,
@@ -46,15 +86,15 @@ class CodeInterpreterToolBridge:
         if not code.strip():
             raise ValueError("code is required")
 
-        sandbox = Sandbox.connect(sid)
+        sandbox = self._get_sandbox(sid)
         context = None
         try:
-            context = sandbox.context.create(
+            context = await sandbox.context.create(
                 language=self._normalize_language(language),
                 cwd=(cwd or "/workspace"),
             )
             timeout = timeout_ms if timeout_ms > 0 else 30000
-            out = context.exec(code, timeout_ms=timeout)
+            out = await context.exec(code, timeout_ms=timeout)
             context_id = out.context_id.strip() or context.context_id
             return {
                 "context_id": context_id,
@@ -70,9 +110,9 @@ class CodeInterpreterToolBridge:
 
     @staticmethod
     def _delete_context_async(context: Any) -> None:
-        def _run() -> None:
+        async def _run() -> None:
             try:
-                context.delete()
+                await context.delete()
             except SDKError as exc:
                 print(
                     f"agentland-sdk: Failed to delete context asynchronously: {exc}",
@@ -84,9 +124,11 @@ class CodeInterpreterToolBridge:
                     file=sys.stderr,
                 )
 
-        Thread(target=_run, daemon=True).start()
+        task = asyncio.get_running_loop().create_task(_run())
+        _CLEANUP_TASKS.add(task)
+        task.add_done_callback(_CLEANUP_TASKS.discard)
 
-    def fs_tree(
+    async def fs_tree(
         self,
         *,
         sandbox_id: str,
@@ -95,16 +137,16 @@ class CodeInterpreterToolBridge:
         includeHidden: bool = False,
     ) -> dict[str, Any]:
         sid = self._require_sandbox_id(sandbox_id)
-        sandbox = Sandbox.connect(sid)
+        sandbox = self._get_sandbox(sid)
         kwargs: dict[str, Any] = {
             "path": path.strip() or ".",
             "include_hidden": includeHidden,
         }
         if depth > 0:
             kwargs["depth"] = depth
-        return sandbox.fs.tree(**kwargs)
+        return await sandbox.fs.tree(**kwargs)
 
-    def fs_file_get(
+    async def fs_file_get(
         self,
         *,
         sandbox_id: str,
@@ -112,12 +154,12 @@ class CodeInterpreterToolBridge:
         encoding: str = "",
     ) -> dict[str, Any]:
         sid = self._require_sandbox_id(sandbox_id)
-        sandbox = Sandbox.connect(sid)
+        sandbox = self._get_sandbox(sid)
         if encoding.strip():
-            return sandbox.fs.read(path=path, encoding=encoding)
-        return sandbox.fs.read(path=path)
+            return await sandbox.fs.read(path=path, encoding=encoding)
+        return await sandbox.fs.read(path=path)
 
-    def fs_file_write(
+    async def fs_file_write(
         self,
         *,
         sandbox_id: str,
@@ -126,7 +168,7 @@ class CodeInterpreterToolBridge:
         encoding: str = "",
     ) -> dict[str, Any]:
         sid = self._require_sandbox_id(sandbox_id)
-        sandbox = Sandbox.connect(sid)
+        sandbox = self._get_sandbox(sid)
         if encoding.strip():
-            return sandbox.fs.write(path=path, content=content, encoding=encoding)
-        return sandbox.fs.write(path=path, content=content)
+            return await sandbox.fs.write(path=path, content=content, encoding=encoding)
+        return await sandbox.fs.write(path=path, content=content)
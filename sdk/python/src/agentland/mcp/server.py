@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 from typing import TYPE_CHECKING
 
 from .bridge import CodeInterpreterToolBridge
@@ -11,7 +11,10 @@ if TYPE_CHECKING:
     from mcp.server.fastmcp import FastMCP
 
 
+@functools.cache
 def _require_fastmcp() -> type["FastMCP"]:
+    # Importing mcp.server.fastmcp pulls pydantic/anyio/httpx; cache the
+    # result so repeated create_server calls pay the import once.
     try:
         from mcp.server.fastmcp import FastMCP
     except ImportError as exc:  # pragma: no cover
@@ -20,7 +23,16 @@ def _require_fastmcp() -> type["FastMCP"]:
 
 
 def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
-    """Create MCP server with tools aligned with gateway MCP."""
+    """Create MCP server with tools aligned with gateway MCP.
+
+    Instances are cached per (base_url, timeout) so repeated calls in one
+    process reuse the already-wired tool set.
+    """
+    return _create_server_cached(base_url, timeout)
+
+
+@functools.lru_cache(maxsize=None)
+def _create_server_cached(base_url: str, timeout: int) -> "FastMCP":
     FastMCP = _require_fastmcp()
     mcp = FastMCP(
         "Agentland Code Runner",
@@ -35,7 +47,7 @@ def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
     @mcp.tool()
     async def sandbox_create() -> dict:
         """Create a code runner sandbox session."""
-        return await asyncio.to_thread(bridge.sandbox_create)
+        return await bridge.sandbox_create()
 
     @mcp.tool()
     async def code_execute(
@@ -47,8 +59,7 @@ def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
         timeout_ms: int = 0,
     ) -> dict:
         """Execute code once in a temporary context that is deleted asynchronously after execution."""
-        return await asyncio.to_thread(
-            bridge.code_execute,
+        return await bridge.code_execute(
             sandbox_id=sandbox_id,
             code=code,
             language=language,
@@ -65,8 +76,7 @@ def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
         includeHidden: bool = False,
     ) -> dict:
         """List files and directories under a path."""
-        return await asyncio.to_thread(
-            bridge.fs_tree,
+        return await bridge.fs_tree(
             sandbox_id=sandbox_id,
             path=path,
             depth=depth,
@@ -81,8 +91,7 @@ def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
         encoding: str = "",
     ) -> dict:
         """Read file content with utf8 or base64 encoding."""
-        return await asyncio.to_thread(
-            bridge.fs_file_get,
+        return await bridge.fs_file_get(
             sandbox_id=sandbox_id,
             path=path,
             encoding=encoding,
@@ -97,8 +106,7 @@ def create_server(*, base_url: str, timeout: int = 30) -> "FastMCP":
         encoding: str = "",
     ) -> dict:
         """Write file content with utf8 or base64 encoding."""
-        return await asyncio.to_thread(
-            bridge.fs_file_write,
+        return await bridge.fs_file_write(
             sandbox_id=sandbox_id,
             path=path,
             content=content,
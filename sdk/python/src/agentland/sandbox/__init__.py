@@ -2,6 +2,14 @@
 
 from .errors import SDKError
 from .results import ExecutionResult, ExecutionStreamEvent
-from .sandbox import Context, Sandbox
+from .sandbox import AsyncContext, AsyncSandbox, Context, Sandbox
 
-__all__ = ["Sandbox", "Context", "ExecutionResult", "ExecutionStreamEvent", "SDKError"]
+__all__ = [
+    "Sandbox",
+    "Context",
+    "AsyncSandbox",
+    "AsyncContext",
+    "ExecutionResult",
+    "ExecutionStreamEvent",
+    "SDKError",
+]
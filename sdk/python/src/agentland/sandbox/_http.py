@@ -2,68 +2,229 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import itertools
 import json
 import mimetypes
 import os
+import threading
 import urllib.parse
-from dataclasses import dataclass
-from typing import IO, Any, Mapping
+from typing import IO, Any, AsyncIterable, Iterable, Mapping, NamedTuple
 
 import httpx
 
 from .errors import SDKError
 
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(raw: bytes | str) -> Any:
+        return orjson.loads(raw)
+
+except ImportError:  # pragma: no cover - exercised only without orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def _loads(raw: bytes | str) -> Any:
+        return json.loads(raw)
+
+
 SESSION_HEADER = "x-agentland-session"
 
+# When the gateway shares the box, a UNIX domain socket skips the TCP
+# loopback stack. Either pass a unix:// base_url or set this env var.
+UDS_ENV = "AGENTLAND_UDS_PATH"
+
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+
+# Shared default headers; passed as-is on calls that add nothing, so the
+# hot path skips building a per-request dict. Never mutated after import.
+_BASE_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "agentland-sdk-python",
+}
+
+
+def _merge_headers(
+    session_id: str | None, headers: dict[str, str] | None
+) -> dict[str, str]:
+    merged = dict(_BASE_HEADERS)
+    if session_id:
+        merged[SESSION_HEADER] = session_id
+    if headers:
+        merged.update(headers)
+    return merged
+
 
-@dataclass(slots=True)
-class _Response:
+def _split_uds_base_url(base_url: str) -> tuple[str, str | None]:
+    """Resolve unix:// URLs and the UDS env override to (base_url, uds path)."""
+    if base_url.startswith("unix://"):
+        return "http://agentland", base_url[len("unix://"):]
+    return base_url, os.getenv(UDS_ENV) or None
+
+
+class _Response(NamedTuple):
     status: int
     headers: Mapping[str, str]
     body: bytes
 
 
 def _decode_json_bytes(raw: bytes) -> Any:
-    if not raw:
-        return None
-    text = raw.decode("utf-8", errors="replace").strip()
-    if not text:
+    if not raw or not raw.strip():
         return None
     try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:
+        return _loads(raw)
+    except ValueError as exc:
+        text = raw.decode("utf-8", errors="replace").strip()
         raise SDKError("response is not valid JSON", response_text=text) from exc
 
 
+def _status_error(status_code: int, body: bytes) -> SDKError:
+    parsed = None
+    if body.strip():
+        try:
+            parsed = _loads(body)
+        except ValueError:
+            parsed = None
+    msg, code = _extract_error_message(parsed, f"http request failed: {status_code}")
+    return SDKError(
+        msg,
+        http_status=status_code,
+        code=code,
+        # Raw bytes; SDKError decodes lazily if response_text is read.
+        response_text=body or None,
+    )
+
+
 def _extract_error_message(data: Any, fallback: str) -> tuple[str, int | None]:
-    if isinstance(data, dict):
+    # Exact type checks: `type(code) is int` also rejects bool (a subclass
+    # of int), collapsing the isinstance chain the old version needed.
+    if type(data) is dict:
         code = data.get("code")
-        if isinstance(code, bool):
-            code = None
-        if not isinstance(code, int):
+        if type(code) is not int:
             code = None
         msg = data.get("msg") or data.get("error") or fallback
-        if not isinstance(msg, str):
-            msg = fallback
-        return msg, code
+        return (msg if type(msg) is str else fallback), code
     return fallback, None
 
 
+_UPLOAD_CHUNK_SIZE = 1 << 20
+_DOWNLOAD_CHUNK_SIZE = 1 << 18
+
+# Boundaries only need to be unique per request, not unpredictable, so a
+# pid+counter token is enough and skips the urandom read uuid4 would do.
+_boundary_seq = itertools.count()
+
+_MULTIPART_PREFIX_TEMPLATE = (
+    b'--%s\r\nContent-Disposition: form-data; name="target_file_path"\r\n\r\n'
+    b'%s\r\n--%s\r\nContent-Disposition: form-data; name="file"; filename="%s"\r\n'
+    b"Content-Type: %s\r\n\r\n"
+)
+
+
+# Warm the extension map at import so the first upload does not pay the
+# tens-of-ms system mime-file scan inside its request.
+mimetypes.init()
+
+
+@functools.lru_cache(maxsize=1024)
+def _guess_content_type(file_name: str) -> str:
+    return mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+
+
+def _next_boundary() -> str:
+    return f"----agentland-{os.getpid()}-{next(_boundary_seq)}"
+
+
+def _multipart_upload_parts(
+    *,
+    boundary: str,
+    target_file_path: str,
+    file_name: str,
+    content_type: str,
+) -> tuple[bytes, bytes]:
+    """Build the static prefix/suffix framing one streamed file field."""
+    token = boundary.encode("ascii")
+    prefix = _MULTIPART_PREFIX_TEMPLATE % (
+        token,
+        target_file_path.encode("utf-8"),
+        token,
+        file_name.encode("utf-8"),
+        content_type.encode("ascii"),
+    )
+    suffix = b"\r\n--%s--\r\n" % token
+    return prefix, suffix
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_query(items: tuple[tuple[str, Any], ...]) -> str:
+    return urllib.parse.urlencode(items, doseq=True)
+
+
+def _build_url(base_url: str, path: str, query: dict[str, Any] | None = None) -> str:
+    url = f"{base_url}{path}"
+    if query:
+        # Endpoints repeat the same few key/value shapes (fs paths, context
+        # ids), so memoizing the encoded form skips urlencode on hot calls.
+        items = tuple((k, v) for k, v in query.items() if v is not None)
+        if items:
+            try:
+                encoded = _encode_query(items)
+            except TypeError:
+                # List-valued parameters (doseq) are unhashable; encode
+                # those directly instead of through the cache.
+                encoded = urllib.parse.urlencode(items, doseq=True)
+            url += "?" + encoded
+    return url
+
+
 class _HTTPClient:
+    __slots__ = ("base_url", "timeout", "_session", "_upload_local", "_refs")
+
     def __init__(self, *, base_url: str, timeout: int) -> None:
         normalized = base_url.strip().rstrip("/")
         if not normalized:
             raise SDKError("base_url is required")
-        self.base_url = normalized
+        self.base_url, uds_path = _split_uds_base_url(normalized)
         self.timeout = timeout
+        # Reused by upload_file so successive uploads do not reallocate a
+        # fresh 1 MiB read buffer per chunk. Thread-local because the
+        # client is shared across sandboxes (and httpx.Client is
+        # thread-safe): concurrent uploads must not interleave reads into
+        # one bytearray. Allocated per thread on first upload.
+        self._upload_local = threading.local()
+        # One pooled client per _HTTPClient so sequential API calls reuse
+        # kept-alive connections instead of dialing per request.
+        self._session = httpx.Client(
+            timeout=timeout,
+            limits=_POOL_LIMITS,
+            transport=httpx.HTTPTransport(uds=uds_path) if uds_path else None,
+        )
+        self._refs = 0
+
+    def _acquire(self) -> _HTTPClient:
+        # The client is shared by every Sandbox built from one
+        # configuration; each owner takes a reference so closing one
+        # sandbox cannot tear the pool out from under the others.
+        self._refs += 1
+        return self
 
-    def _build_url(self, path: str, query: dict[str, Any] | None = None) -> str:
-        url = f"{self.base_url}{path}"
-        if query:
-            clean = {k: v for k, v in query.items() if v is not None}
-            if clean:
-                url += "?" + urllib.parse.urlencode(clean)
-        return url
+    def close(self) -> None:
+        """Release one owner's reference, closing the pool with the last."""
+        self._refs -= 1
+        if self._refs <= 0:
+            self._session.close()
+
+    def __enter__(self) -> _HTTPClient:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def _request(
         self,
@@ -73,7 +234,7 @@ class _HTTPClient:
         session_id: str | None = None,
         query: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        body: bytes | None = None,
+        body: bytes | Iterable[bytes] | None = None,
     ) -> _Response:
         return self._dispatch(
             method,
@@ -92,41 +253,28 @@ class _HTTPClient:
         session_id: str | None = None,
         query: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        body: bytes | None = None,
+        body: bytes | Iterable[bytes] | None = None,
         form_data: dict[str, str] | None = None,
         files: dict[str, tuple[str, IO[bytes], str]] | None = None,
     ) -> _Response:
-        request_headers = {} if headers is None else dict(headers)
-        if session_id:
-            request_headers[SESSION_HEADER] = session_id
+        if headers is None and session_id is None:
+            request_headers = _BASE_HEADERS
+        else:
+            request_headers = _merge_headers(session_id, headers)
         try:
-            resp = httpx.request(
+            resp = self._session.request(
                 method,
-                self._build_url(path, query),
+                _build_url(self.base_url, path, query),
                 headers=request_headers,
                 content=body,
                 data=form_data,
                 files=files,
-                timeout=self.timeout,
             )
         except httpx.RequestError as exc:
             raise SDKError(f"http request failed: {exc}") from exc
 
         if resp.status_code >= 400:
-            text = resp.text
-            parsed = None
-            if text.strip():
-                try:
-                    parsed = json.loads(text)
-                except json.JSONDecodeError:
-                    parsed = None
-            msg, code = _extract_error_message(parsed, f"http request failed: {resp.status_code}")
-            raise SDKError(
-                msg,
-                http_status=resp.status_code,
-                code=code,
-                response_text=text or None,
-            )
+            raise _status_error(resp.status_code, resp.content)
 
         return _Response(
             status=resp.status_code,
@@ -136,16 +284,20 @@ class _HTTPClient:
 
     @staticmethod
     def _unwrap_json_result(payload: Any) -> dict[str, Any]:
-        if isinstance(payload, dict) and "code" in payload and "msg" in payload:
-            code = payload.get("code")
-            msg = payload.get("msg", "request failed")
-            if code != 200:
-                raise SDKError(str(msg), code=code if isinstance(code, int) else None)
-            data = payload.get("data")
-            if not isinstance(data, dict):
-                raise SDKError("response data is empty or invalid", code=200)
-            return data
-        if isinstance(payload, dict):
+        # The server envelope shape is fixed, so the happy path is a
+        # couple of dict lookups; only exotic payloads fall through.
+        if type(payload) is dict:
+            if "code" in payload and "msg" in payload:
+                code = payload.get("code")
+                if code == 200:
+                    data = payload.get("data")
+                    if type(data) is dict:
+                        return data
+                    raise SDKError("response data is empty or invalid", code=200)
+                raise SDKError(
+                    str(payload.get("msg", "request failed")),
+                    code=code if type(code) is int else None,
+                )
             return payload
         raise SDKError("response JSON must be an object")
 
@@ -161,7 +313,7 @@ class _HTTPClient:
         body = None
         headers: dict[str, str] = {}
         if json_body is not None:
-            body = json.dumps(json_body).encode("utf-8")
+            body = _dumps(json_body)
             headers["Content-Type"] = "application/json"
         resp = self._request(
             method,
@@ -200,29 +352,16 @@ class _HTTPClient:
         )
 
         try:
-            with httpx.stream(
+            with self._session.stream(
                 method,
-                self._build_url(path, query),
+                _build_url(self.base_url, path, query),
                 headers=headers,
                 json=json_body,
                 timeout=timeout,
             ) as resp:
                 if resp.status_code >= 400:
                     raw = resp.read()
-                    text = raw.decode("utf-8", errors="replace")
-                    parsed = None
-                    if text.strip():
-                        try:
-                            parsed = json.loads(text)
-                        except json.JSONDecodeError:
-                            parsed = None
-                    msg, code = _extract_error_message(parsed, f"http request failed: {resp.status_code}")
-                    raise SDKError(
-                        msg,
-                        http_status=resp.status_code,
-                        code=code,
-                        response_text=text or None,
-                    )
+                    raise _status_error(resp.status_code, raw)
 
                 for line in resp.iter_lines():
                     if not line:
@@ -235,8 +374,8 @@ class _HTTPClient:
                     if data.startswith("data:"):
                         data = data[5:].strip()
                     try:
-                        evt = json.loads(data)
-                    except json.JSONDecodeError:
+                        evt = _loads(data)
+                    except ValueError:
                         continue
                     if isinstance(evt, dict):
                         yield evt
@@ -249,29 +388,306 @@ class _HTTPClient:
         session_id: str,
         local_file: str,
         target_file_path: str,
+        content_type: str | None = None,
     ) -> dict[str, Any]:
         file_name = os.path.basename(local_file)
-        guessed_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
-        with open(local_file, "rb") as fh:
-            resp = self._dispatch(
-                "POST",
-                "/api/code-runner/fs/upload",
-                session_id=session_id,
-                form_data={"target_file_path": target_file_path},
-                files={"file": (file_name, fh, guessed_type)},
-            )
+        guessed_type = content_type or _guess_content_type(file_name)
+        file_size = os.stat(local_file).st_size
+        boundary = _next_boundary()
+        prefix, suffix = _multipart_upload_parts(
+            boundary=boundary,
+            target_file_path=target_file_path,
+            file_name=file_name,
+            content_type=guessed_type,
+        )
+
+        buf = getattr(self._upload_local, "buf", None)
+        if buf is None:
+            buf = self._upload_local.buf = bytearray(_UPLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+
+        def _body():
+            # Each yielded slice is written out by httpx before the next
+            # readinto, so reusing one buffer across chunks is safe here.
+            yield prefix
+            with open(local_file, "rb") as fh:
+                while n := fh.readinto(buf):
+                    yield view[:n]
+            yield suffix
+
+        resp = self._dispatch(
+            "POST",
+            "/api/code-runner/fs/upload",
+            session_id=session_id,
+            headers={
+                "Content-Type": f"multipart/form-data; boundary={boundary}",
+                "Content-Length": str(len(prefix) + file_size + len(suffix)),
+            },
+            body=_body(),
+        )
         payload = _decode_json_bytes(resp.body)
         return self._unwrap_json_result(payload)
 
-    def download_file(
+    def stream_download(
         self,
         *,
         session_id: str,
         remote_path: str,
+        sink_path: str,
+    ) -> tuple[int, Mapping[str, str]]:
+        """Stream a remote file straight into sink_path.
+
+        The body never materializes as one bytes object; peak memory stays
+        at one chunk. Returns (size, response headers) for metadata.
+        """
+        parent = os.path.dirname(sink_path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        try:
+            with self._session.stream(
+                "GET",
+                _build_url(
+                    self.base_url,
+                    "/api/code-runner/fs/download",
+                    {"path": remote_path},
+                ),
+                headers={SESSION_HEADER: session_id},
+            ) as resp:
+                if resp.status_code >= 400:
+                    raw = resp.read()
+                    raise _status_error(resp.status_code, raw)
+                size = 0
+                with open(sink_path, "wb") as fh:
+                    for chunk in resp.iter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        fh.write(chunk)
+                        size += len(chunk)
+                return size, resp.headers
+        except httpx.RequestError as exc:
+            raise SDKError(f"http request failed: {exc}") from exc
+
+
+class _AsyncHTTPClient:
+    """Async mirror of _HTTPClient backed by httpx.AsyncClient."""
+
+    __slots__ = ("base_url", "timeout", "_session", "_refs")
+
+    def __init__(self, *, base_url: str, timeout: int) -> None:
+        normalized = base_url.strip().rstrip("/")
+        if not normalized:
+            raise SDKError("base_url is required")
+        self.base_url, uds_path = _split_uds_base_url(normalized)
+        self.timeout = timeout
+        self._session = httpx.AsyncClient(
+            timeout=timeout,
+            limits=_POOL_LIMITS,
+            transport=httpx.AsyncHTTPTransport(uds=uds_path) if uds_path else None,
+        )
+        self._refs = 0
+
+    def _acquire(self) -> _AsyncHTTPClient:
+        self._refs += 1
+        return self
+
+    async def _dispatch(
+        self,
+        method: str,
+        path: str,
+        *,
+        session_id: str | None = None,
+        query: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        body: bytes | AsyncIterable[bytes] | None = None,
+        form_data: dict[str, str] | None = None,
+        files: dict[str, tuple[str, IO[bytes], str]] | None = None,
     ) -> _Response:
-        return self._request(
-            "GET",
-            "/api/code-runner/fs/download",
+        if headers is None and session_id is None:
+            request_headers = _BASE_HEADERS
+        else:
+            request_headers = _merge_headers(session_id, headers)
+        try:
+            resp = await self._session.request(
+                method,
+                _build_url(self.base_url, path, query),
+                headers=request_headers,
+                content=body,
+                data=form_data,
+                files=files,
+            )
+        except httpx.RequestError as exc:
+            raise SDKError(f"http request failed: {exc}") from exc
+
+        if resp.status_code >= 400:
+            raise _status_error(resp.status_code, resp.content)
+
+        return _Response(
+            status=resp.status_code,
+            headers=resp.headers,
+            body=resp.content,
+        )
+
+    async def request_json(
+        self,
+        method: str,
+        path: str,
+        *,
+        session_id: str | None = None,
+        query: dict[str, Any] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        body = None
+        headers: dict[str, str] = {}
+        if json_body is not None:
+            body = _dumps(json_body)
+            headers["Content-Type"] = "application/json"
+        resp = await self._dispatch(
+            method,
+            path,
             session_id=session_id,
-            query={"path": remote_path},
+            query=query,
+            headers=headers,
+            body=body,
+        )
+        payload = _decode_json_bytes(resp.body)
+        return _HTTPClient._unwrap_json_result(payload)
+
+    async def stream_sse_json(
+        self,
+        method: str,
+        path: str,
+        *,
+        session_id: str,
+        json_body: dict[str, Any] | None = None,
+        query: dict[str, Any] | None = None,
+    ):
+        headers: dict[str, str] = {
+            "Accept": "text/event-stream",
+            "Cache-Control": "no-cache",
+        }
+        if json_body is not None:
+            headers["Content-Type"] = "application/json"
+
+        headers[SESSION_HEADER] = session_id
+
+        timeout = httpx.Timeout(
+            connect=self.timeout,
+            read=None,  # streaming
+            write=self.timeout,
+            pool=None,
         )
+
+        try:
+            async with self._session.stream(
+                method,
+                _build_url(self.base_url, path, query),
+                headers=headers,
+                json=json_body,
+                timeout=timeout,
+            ) as resp:
+                if resp.status_code >= 400:
+                    raw = await resp.aread()
+                    raise _status_error(resp.status_code, raw)
+
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    data = line.strip()
+                    if not data:
+                        continue
+                    if data.startswith(":"):
+                        continue
+                    if data.startswith("data:"):
+                        data = data[5:].strip()
+                    try:
+                        evt = _loads(data)
+                    except ValueError:
+                        continue
+                    if isinstance(evt, dict):
+                        yield evt
+        except httpx.RequestError as exc:
+            raise SDKError(f"http request failed: {exc}") from exc
+
+    async def upload_file(
+        self,
+        *,
+        session_id: str,
+        local_file: str,
+        target_file_path: str,
+        content_type: str | None = None,
+    ) -> dict[str, Any]:
+        file_name = os.path.basename(local_file)
+        guessed_type = content_type or _guess_content_type(file_name)
+        boundary = _next_boundary()
+        prefix, suffix = _multipart_upload_parts(
+            boundary=boundary,
+            target_file_path=target_file_path,
+            file_name=file_name,
+            content_type=guessed_type,
+        )
+
+        async def _body():
+            # Disk reads go through asyncio.to_thread so a slow filesystem
+            # never stalls the event loop between chunks.
+            yield prefix
+            fh = await asyncio.to_thread(open, local_file, "rb")
+            try:
+                while chunk := await asyncio.to_thread(fh.read, _UPLOAD_CHUNK_SIZE):
+                    yield chunk
+            finally:
+                fh.close()
+            yield suffix
+
+        resp = await self._dispatch(
+            "POST",
+            "/api/code-runner/fs/upload",
+            session_id=session_id,
+            headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+            body=_body(),
+        )
+        payload = _decode_json_bytes(resp.body)
+        return _HTTPClient._unwrap_json_result(payload)
+
+    async def stream_download(
+        self,
+        *,
+        session_id: str,
+        remote_path: str,
+        sink_path: str,
+    ) -> tuple[int, Mapping[str, str]]:
+        """Async mirror of _HTTPClient.stream_download.
+
+        Network chunks arrive via aiter_bytes; blocking disk writes are
+        offloaded with asyncio.to_thread so the event loop stays free.
+        """
+        parent = os.path.dirname(sink_path)
+        if parent:
+            await asyncio.to_thread(os.makedirs, parent, exist_ok=True)
+        try:
+            async with self._session.stream(
+                "GET",
+                _build_url(
+                    self.base_url,
+                    "/api/code-runner/fs/download",
+                    {"path": remote_path},
+                ),
+                headers={SESSION_HEADER: session_id},
+            ) as resp:
+                if resp.status_code >= 400:
+                    raw = await resp.aread()
+                    raise _status_error(resp.status_code, raw)
+                size = 0
+                fh = await asyncio.to_thread(open, sink_path, "wb")
+                try:
+                    async for chunk in resp.aiter_bytes(_DOWNLOAD_CHUNK_SIZE):
+                        await asyncio.to_thread(fh.write, chunk)
+                        size += len(chunk)
+                finally:
+                    await asyncio.to_thread(fh.close)
+                return size, resp.headers
+        except httpx.RequestError as exc:
+            raise SDKError(f"http request failed: {exc}") from exc
+
+    async def aclose(self) -> None:
+        """Release one owner's reference, closing the pool with the last."""
+        self._refs -= 1
+        if self._refs <= 0:
+            await self._session.aclose()
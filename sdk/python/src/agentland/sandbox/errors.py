@@ -12,18 +12,32 @@ class SDKError(Exception):
         *,
         http_status: int | None = None,
         code: int | None = None,
-        response_text: str | None = None,
+        response_text: str | bytes | None = None,
     ) -> None:
         super().__init__(message)
         self.http_status = http_status
         self.code = code
-        self.response_text = response_text
+        self._response_raw = response_text
+        self._str: str | None = None
+
+    @property
+    def response_text(self) -> str | None:
+        # Raw bytes are decoded on first access, so raising on a large
+        # error body never pays for a decode nobody reads.
+        raw = self._response_raw
+        if isinstance(raw, bytes):
+            raw = self._response_raw = raw.decode("utf-8", errors="replace")
+        return raw
 
     def __str__(self) -> str:
-        parts = [super().__str__()]
-        if self.http_status is not None:
-            parts.append(f"http_status={self.http_status}")
-        if self.code is not None:
-            parts.append(f"code={self.code}")
-        return ", ".join(parts)
+        # Retry loops stringify the same exception repeatedly; build once.
+        rendered = self._str
+        if rendered is None:
+            rendered = super().__str__()
+            if self.http_status is not None:
+                rendered += f", http_status={self.http_status}"
+            if self.code is not None:
+                rendered += f", code={self.code}"
+            self._str = rendered
+        return rendered
 
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import io
 import os
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Mapping, Sequence
 
-from ._http import _HTTPClient
+from ._http import _AsyncHTTPClient, _HTTPClient
 from .errors import SDKError
 from .results import ExecutionResult, ExecutionStreamEvent
 
 DEFAULT_TIMEOUT_SECONDS = 30
 
 
+# Validation helpers run on every context.create/exec; agents loop over
+# the same handful of values, so memoizing them skips the string work.
+@functools.lru_cache(maxsize=16)
 def _normalize_language(language: str) -> str:
     value = language.strip().lower()
     if value not in {"python", "bash"}:
@@ -20,6 +26,7 @@ def _normalize_language(language: str) -> str:
     return value
 
 
+@functools.lru_cache(maxsize=16)
 def _ensure_timeout(timeout_ms: int) -> int:
     if timeout_ms < 100 or timeout_ms > 300000:
         raise SDKError("timeout_ms must be between 100 and 300000")
@@ -27,6 +34,9 @@ def _ensure_timeout(timeout_ms: int) -> int:
 
 
 def _ensure_non_empty(name: str, value: str) -> str:
+    # Most callers pass an already-clean string; skip the strip copy.
+    if value and not value[0].isspace() and not value[-1].isspace():
+        return value
     cleaned = value.strip()
     if not cleaned:
         raise SDKError(f"{name} is required")
@@ -42,13 +52,17 @@ class _SDKConfig:
 class Sandbox:
     """Represents one code-runner sandbox session."""
 
+    __slots__ = ("sandbox_id", "_client_impl", "context", "fs")
+
     _config = _SDKConfig()
+    _client_cache: _HTTPClient | None = None
 
     @classmethod
     def configure(
         cls, *, base_url: str, timeout: int = DEFAULT_TIMEOUT_SECONDS
     ) -> None:
         cls._config = _SDKConfig(base_url=base_url.strip().rstrip("/"), timeout=timeout)
+        cls._client_cache = None
 
     @classmethod
     def _client(cls) -> _HTTPClient:
@@ -56,13 +70,22 @@ class Sandbox:
             raise SDKError(
                 "SDK is not configured. Call Sandbox.configure(base_url=...) first"
             )
-        return _HTTPClient(base_url=cls._config.base_url, timeout=cls._config.timeout)
+        # One client (and connection pool) per configuration; configure()
+        # invalidates, so every sandbox shares the warm pool.
+        client = cls._client_cache
+        if client is None:
+            client = _HTTPClient(
+                base_url=cls._config.base_url, timeout=cls._config.timeout
+            )
+            cls._client_cache = client
+        return client
 
     @classmethod
     def create(cls) -> Sandbox:
-        out = cls._client().request_json("POST", "/api/code-runner/sandboxes")
+        client = cls._client()
+        out = client.request_json("POST", "/api/code-runner/sandboxes")
         sandbox_id = _ensure_non_empty("sandbox_id", str(out.get("sandbox_id", "")))
-        return cls(sandbox_id=sandbox_id, _client=cls._client())
+        return cls(sandbox_id=sandbox_id, _client=client)
 
     @classmethod
     def connect(cls, sandbox_id: str) -> Sandbox:
@@ -74,12 +97,70 @@ class Sandbox:
 
     def __init__(self, *, sandbox_id: str, _client: _HTTPClient) -> None:
         self.sandbox_id = sandbox_id
-        self._client_impl = _client
+        self._client_impl = _client._acquire()
         self.context = _ContextService(self)
         self.fs = _FSService(self)
 
+    def close(self) -> None:
+        """Release this sandbox's share of the HTTP client.
+
+        The client is reference-counted because it is shared by every
+        sandbox built from one configuration; the connection pool closes
+        only when the last owner is closed. Call at most once.
+        """
+        client = self._client_impl
+        client.close()
+        cls = type(self)
+        if client._refs <= 0 and cls._client_cache is client:
+            cls._client_cache = None
+
+    def batch(self, ops: Sequence[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """Run several independent JSON API calls concurrently.
+
+        Each op is a mapping with "method" and "path" plus optional
+        "json_body", "query", and "session_id" (defaulting to this
+        sandbox's id). Results come back in op order, so N small calls
+        cost roughly one round trip instead of N.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise SDKError(
+                "Sandbox.batch cannot run inside an event loop; use AsyncSandbox"
+            )
+
+        config = type(self)._config
+
+        async def _run() -> list[dict[str, Any]]:
+            client = _AsyncHTTPClient(
+                base_url=config.base_url, timeout=config.timeout
+            )
+            try:
+                return list(
+                    await asyncio.gather(
+                        *(
+                            client.request_json(
+                                op["method"],
+                                op["path"],
+                                session_id=op.get("session_id", self.sandbox_id),
+                                query=op.get("query"),
+                                json_body=op.get("json_body"),
+                            )
+                            for op in ops
+                        )
+                    )
+                )
+            finally:
+                await client.aclose()
+
+        return asyncio.run(_run())
+
 
 class _ContextService:
+    __slots__ = ("_sandbox",)
+
     def __init__(self, sandbox: Sandbox) -> None:
         self._sandbox = sandbox
 
@@ -100,13 +181,19 @@ class _ContextService:
 class Context:
     """Represents one execution context inside a sandbox."""
 
+    __slots__ = ("_sandbox", "context_id", "_execute_path", "_delete_path")
+
     def __init__(self, *, sandbox: Sandbox, context_id: str) -> None:
         self._sandbox = sandbox
         self.context_id = _ensure_non_empty("context_id", context_id)
+        # Endpoint paths are fixed for a context's lifetime; build them
+        # once instead of re-formatting on every exec/delete.
+        self._delete_path = f"/api/code-runner/contexts/{self.context_id}"
+        self._execute_path = self._delete_path + "/execute"
 
     def exec(self, code: str, timeout_ms: int = 30000) -> ExecutionResult:
-        stdout_chunks: list[str] = []
-        stderr_chunks: list[str] = []
+        stdout_buf = io.StringIO()
+        stderr_buf = io.StringIO()
         last_execution_count = 0
         last_exit_code = 0
         last_duration_ms = 0
@@ -115,9 +202,9 @@ class Context:
             if evt.type == "error":
                 raise SDKError(evt.error or "execution failed")
             if evt.type == "stdout" and evt.text:
-                stdout_chunks.append(evt.text)
+                stdout_buf.write(evt.text)
             if evt.type == "stderr" and evt.text:
-                stderr_chunks.append(evt.text)
+                stderr_buf.write(evt.text)
             if (
                 evt.type == "count"
                 and evt.execution_count is not None
@@ -133,8 +220,8 @@ class Context:
                     context_id=self.context_id,
                     execution_count=last_execution_count,
                     exit_code=last_exit_code,
-                    stdout="".join(stdout_chunks),
-                    stderr="".join(stderr_chunks),
+                    stdout=stdout_buf.getvalue(),
+                    stderr=stderr_buf.getvalue(),
                     duration_ms=last_duration_ms,
                 )
 
@@ -147,7 +234,7 @@ class Context:
         }
         for raw_evt in self._sandbox._client_impl.stream_sse_json(
             "POST",
-            f"/api/code-runner/contexts/{self.context_id}/execute",
+            self._execute_path,
             session_id=self._sandbox.sandbox_id,
             json_body=payload,
         ):
@@ -156,12 +243,14 @@ class Context:
     def delete(self) -> dict[str, Any]:
         return self._sandbox._client_impl.request_json(
             "DELETE",
-            f"/api/code-runner/contexts/{self.context_id}",
+            self._delete_path,
             session_id=self._sandbox.sandbox_id,
         )
 
 
 class _FSService:
+    __slots__ = ("_sandbox",)
+
     def __init__(self, sandbox: Sandbox) -> None:
         self._sandbox = sandbox
 
@@ -206,7 +295,9 @@ class _FSService:
             json_body=payload,
         )
 
-    def upload(self, file: str, target_file_path: str) -> dict[str, Any]:
+    def upload(
+        self, file: str, target_file_path: str, content_type: str | None = None
+    ) -> dict[str, Any]:
         local_file = _ensure_non_empty("file", file)
         target = _ensure_non_empty("target_file_path", target_file_path)
         if not os.path.isfile(local_file):
@@ -215,35 +306,262 @@ class _FSService:
             session_id=self._sandbox.sandbox_id,
             local_file=local_file,
             target_file_path=target,
+            content_type=content_type,
         )
 
     def download(self, path: str, save_path: str) -> dict[str, Any]:
         remote = _ensure_non_empty("path", path)
         local = _ensure_non_empty("save_path", save_path)
-        resp = self._sandbox._client_impl.download_file(
+        size, headers = self._sandbox._client_impl.stream_download(
             session_id=self._sandbox.sandbox_id,
             remote_path=remote,
+            sink_path=local,
+        )
+        return _download_result(headers, size, remote, local)
+
+
+def _download_result(
+    headers: Mapping[str, str], size: int, remote: str, local: str
+) -> dict[str, Any]:
+    file_name = ""
+    content_disposition = headers.get("Content-Disposition", "")
+    marker = "filename="
+    if marker in content_disposition:
+        raw_name = content_disposition.split(marker, 1)[1].strip()
+        file_name = raw_name.strip('"')
+    if not file_name:
+        file_name = os.path.basename(local)
+
+    return {
+        "source_path": headers.get("X-Agentland-File-Path", remote),
+        "save_path": local,
+        "file_name": file_name,
+        "size": size,
+    }
+
+
+class AsyncSandbox:
+    """Async mirror of Sandbox for event-loop callers."""
+
+    __slots__ = ("sandbox_id", "_client_impl", "context", "fs")
+
+    _config = _SDKConfig()
+    _client_cache: _AsyncHTTPClient | None = None
+
+    @classmethod
+    def configure(
+        cls, *, base_url: str, timeout: int = DEFAULT_TIMEOUT_SECONDS
+    ) -> None:
+        cls._config = _SDKConfig(base_url=base_url.strip().rstrip("/"), timeout=timeout)
+        cls._client_cache = None
+
+    @classmethod
+    def _client(cls) -> _AsyncHTTPClient:
+        if not cls._config.base_url:
+            raise SDKError(
+                "SDK is not configured. Call AsyncSandbox.configure(base_url=...) first"
+            )
+        client = cls._client_cache
+        if client is None:
+            client = _AsyncHTTPClient(
+                base_url=cls._config.base_url, timeout=cls._config.timeout
+            )
+            cls._client_cache = client
+        return client
+
+    @classmethod
+    async def create(cls) -> AsyncSandbox:
+        client = cls._client()
+        out = await client.request_json("POST", "/api/code-runner/sandboxes")
+        sandbox_id = _ensure_non_empty("sandbox_id", str(out.get("sandbox_id", "")))
+        return cls(sandbox_id=sandbox_id, _client=client)
+
+    @classmethod
+    def connect(cls, sandbox_id: str) -> AsyncSandbox:
+        # Connect does not call server-side lookup by design.
+        return cls(
+            sandbox_id=_ensure_non_empty("sandbox_id", sandbox_id),
+            _client=cls._client(),
+        )
+
+    def __init__(self, *, sandbox_id: str, _client: _AsyncHTTPClient) -> None:
+        self.sandbox_id = sandbox_id
+        self._client_impl = _client._acquire()
+        self.context = _AsyncContextService(self)
+        self.fs = _AsyncFSService(self)
+
+    async def aclose(self) -> None:
+        """Release this sandbox's share of the HTTP client.
+
+        Reference-counted like Sandbox.close: the pool closes only when
+        the last owner is closed. Call at most once.
+        """
+        client = self._client_impl
+        await client.aclose()
+        cls = type(self)
+        if client._refs <= 0 and cls._client_cache is client:
+            cls._client_cache = None
+
+
+class _AsyncContextService:
+    __slots__ = ("_sandbox",)
+
+    def __init__(self, sandbox: AsyncSandbox) -> None:
+        self._sandbox = sandbox
+
+    async def create(
+        self, language: str = "python", cwd: str = "/workspace"
+    ) -> AsyncContext:
+        payload: dict[str, Any] = {"language": _normalize_language(language)}
+        if cwd.strip():
+            payload["cwd"] = cwd.strip()
+        out = await self._sandbox._client_impl.request_json(
+            "POST",
+            "/api/code-runner/contexts",
+            session_id=self._sandbox.sandbox_id,
+            json_body=payload,
+        )
+        context_id = _ensure_non_empty("context_id", str(out.get("context_id", "")))
+        return AsyncContext(sandbox=self._sandbox, context_id=context_id)
+
+
+class AsyncContext:
+    """Async mirror of Context."""
+
+    __slots__ = ("_sandbox", "context_id", "_execute_path", "_delete_path")
+
+    def __init__(self, *, sandbox: AsyncSandbox, context_id: str) -> None:
+        self._sandbox = sandbox
+        self.context_id = _ensure_non_empty("context_id", context_id)
+        self._delete_path = f"/api/code-runner/contexts/{self.context_id}"
+        self._execute_path = self._delete_path + "/execute"
+
+    async def exec(self, code: str, timeout_ms: int = 30000) -> ExecutionResult:
+        stdout_buf = io.StringIO()
+        stderr_buf = io.StringIO()
+        last_execution_count = 0
+        last_exit_code = 0
+        last_duration_ms = 0
+
+        async for evt in self.exec_stream(code, timeout_ms=timeout_ms):
+            if evt.type == "error":
+                raise SDKError(evt.error or "execution failed")
+            if evt.type == "stdout" and evt.text:
+                stdout_buf.write(evt.text)
+            if evt.type == "stderr" and evt.text:
+                stderr_buf.write(evt.text)
+            if (
+                evt.type == "count"
+                and evt.execution_count is not None
+                and evt.execution_count > 0
+            ):
+                last_execution_count = evt.execution_count
+            if evt.type == "execution_complete":
+                if evt.execution_time is not None and evt.execution_time >= 0:
+                    last_duration_ms = evt.execution_time
+                if evt.exit_code is not None:
+                    last_exit_code = evt.exit_code
+                return ExecutionResult(
+                    context_id=self.context_id,
+                    execution_count=last_execution_count,
+                    exit_code=last_exit_code,
+                    stdout=stdout_buf.getvalue(),
+                    stderr=stderr_buf.getvalue(),
+                    duration_ms=last_duration_ms,
+                )
+
+        raise SDKError("execution stream ended without an execution_complete event")
+
+    async def exec_stream(self, code: str, timeout_ms: int = 30000):
+        payload = {
+            "code": _ensure_non_empty("code", code),
+            "timeout_ms": _ensure_timeout(timeout_ms),
+        }
+        async for raw_evt in self._sandbox._client_impl.stream_sse_json(
+            "POST",
+            self._execute_path,
+            session_id=self._sandbox.sandbox_id,
+            json_body=payload,
+        ):
+            yield ExecutionStreamEvent.from_payload(raw_evt)
+
+    async def delete(self) -> dict[str, Any]:
+        return await self._sandbox._client_impl.request_json(
+            "DELETE",
+            self._delete_path,
+            session_id=self._sandbox.sandbox_id,
+        )
+
+
+class _AsyncFSService:
+    __slots__ = ("_sandbox",)
+
+    def __init__(self, sandbox: AsyncSandbox) -> None:
+        self._sandbox = sandbox
+
+    async def tree(
+        self,
+        path: str = ".",
+        depth: int = 5,
+        include_hidden: bool = False,
+    ) -> dict[str, Any]:
+        if depth < 1 or depth > 20:
+            raise SDKError("depth must be between 1 and 20")
+        return await self._sandbox._client_impl.request_json(
+            "GET",
+            "/api/code-runner/fs/tree",
+            session_id=self._sandbox.sandbox_id,
+            query={
+                "path": path,
+                "depth": depth,
+                "includeHidden": "true" if include_hidden else "false",
+            },
         )
 
-        parent = os.path.dirname(local)
-        if parent:
-            os.makedirs(parent, exist_ok=True)
-        with open(local, "wb") as fh:
-            fh.write(resp.body)
-
-        file_name = ""
-        content_disposition = resp.headers.get("Content-Disposition", "")
-        marker = "filename="
-        if marker in content_disposition:
-            raw_name = content_disposition.split(marker, 1)[1].strip()
-            file_name = raw_name.strip('"')
-        if not file_name:
-            file_name = os.path.basename(local)
-
-        source_path = resp.headers.get("X-Agentland-File-Path", remote)
-        return {
-            "source_path": source_path,
-            "save_path": local,
-            "file_name": file_name,
-            "size": len(resp.body),
+    async def read(self, path: str, encoding: str = "utf8") -> dict[str, Any]:
+        clean_path = _ensure_non_empty("path", path)
+        return await self._sandbox._client_impl.request_json(
+            "GET",
+            "/api/code-runner/fs/file",
+            session_id=self._sandbox.sandbox_id,
+            query={"path": clean_path, "encoding": encoding},
+        )
+
+    async def write(
+        self, path: str, content: str, encoding: str = "utf8"
+    ) -> dict[str, Any]:
+        payload = {
+            "path": _ensure_non_empty("path", path),
+            "content": content,
+            "encoding": encoding,
         }
+        return await self._sandbox._client_impl.request_json(
+            "POST",
+            "/api/code-runner/fs/file",
+            session_id=self._sandbox.sandbox_id,
+            json_body=payload,
+        )
+
+    async def upload(
+        self, file: str, target_file_path: str, content_type: str | None = None
+    ) -> dict[str, Any]:
+        local_file = _ensure_non_empty("file", file)
+        target = _ensure_non_empty("target_file_path", target_file_path)
+        if not os.path.isfile(local_file):
+            raise SDKError(f"file does not exist: {local_file}")
+        return await self._sandbox._client_impl.upload_file(
+            session_id=self._sandbox.sandbox_id,
+            local_file=local_file,
+            target_file_path=target,
+            content_type=content_type,
+        )
+
+    async def download(self, path: str, save_path: str) -> dict[str, Any]:
+        remote = _ensure_non_empty("path", path)
+        local = _ensure_non_empty("save_path", save_path)
+        size, headers = await self._sandbox._client_impl.stream_download(
+            session_id=self._sandbox.sandbox_id,
+            remote_path=remote,
+            sink_path=local,
+        )
+        return _download_result(headers, size, remote, local)
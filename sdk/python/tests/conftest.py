@@ -0,0 +1,33 @@
+"""Shared test setup: make the src layout importable once per run."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _tmpfs():
+    # Land tempfile allocations in RAM where /dev/shm exists so tests
+    # never wait on a disk-backed tmp mount; a no-op elsewhere.
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        previous_env = os.environ.get("TMPDIR")
+        previous_dir = tempfile.tempdir
+        os.environ["TMPDIR"] = "/dev/shm"
+        tempfile.tempdir = "/dev/shm"
+        yield
+        tempfile.tempdir = previous_dir
+        if previous_env is None:
+            os.environ.pop("TMPDIR", None)
+        else:
+            os.environ["TMPDIR"] = previous_env
+    else:
+        yield
@@ -1,12 +1,8 @@
 from __future__ import annotations
 
-import sys
 import unittest
-from pathlib import Path
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 from agentland import cli
 
 
@@ -42,6 +38,24 @@ class CLITests(unittest.TestCase):
             timeout=30,
         )
 
+    @mock.patch("agentland.cli._run_mcp_supervisor")
+    def test_agentland_mcp_supervisor_invokes_runner(self, run_sup: mock.Mock) -> None:
+        rc = cli.main(
+            [
+                "mcp-supervisor",
+                "--socket",
+                "/tmp/agentland-mcp.sock",
+                "--base-url",
+                "http://127.0.0.1:18080",
+            ]
+        )
+        self.assertEqual(0, rc)
+        run_sup.assert_called_once_with(
+            socket_path="/tmp/agentland-mcp.sock",
+            base_url="http://127.0.0.1:18080",
+            timeout=30,
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
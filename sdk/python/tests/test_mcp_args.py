@@ -1,13 +1,9 @@
 from __future__ import annotations
 
 import argparse
-import sys
 import unittest
-from pathlib import Path
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 from agentland import _mcp_args
 
 
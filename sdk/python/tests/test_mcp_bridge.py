@@ -1,13 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import io
-import sys
 import unittest
-from pathlib import Path
 from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
-
 from agentland.mcp.bridge import CodeInterpreterToolBridge
 from agentland.sandbox import ExecutionResult
 
@@ -16,7 +13,7 @@ class _FakeContext:
     def __init__(self, *, context_id: str = "ctx-1") -> None:
         self.context_id = context_id
 
-    def exec(self, code: str, timeout_ms: int = 30000) -> ExecutionResult:
+    async def exec(self, code: str, timeout_ms: int = 30000) -> ExecutionResult:
         return ExecutionResult(
             context_id=self.context_id,
             execution_count=1,
@@ -26,7 +23,7 @@ class _FakeContext:
             duration_ms=5,
         )
 
-    def delete(self) -> dict:
+    async def delete(self) -> dict:
         return {"context_id": self.context_id}
 
 
@@ -35,7 +32,7 @@ class _FakeContextService:
         self.created = []
         self.ctx = _FakeContext()
 
-    def create(self, language: str = "python", cwd: str = "/workspace") -> _FakeContext:
+    async def create(self, language: str = "python", cwd: str = "/workspace") -> _FakeContext:
         self.created.append({"language": language, "cwd": cwd})
         return self.ctx
 
@@ -44,11 +41,11 @@ class _FakeFSService:
     def __init__(self) -> None:
         self.calls = []
 
-    def tree(self, **kwargs) -> dict:
+    async def tree(self, **kwargs) -> dict:
         self.calls.append(("tree", kwargs))
         return {"root": kwargs.get("path", "."), "nodes": []}
 
-    def read(self, **kwargs) -> dict:
+    async def read(self, **kwargs) -> dict:
         self.calls.append(("read", kwargs))
         return {
             "path": kwargs["path"],
@@ -57,7 +54,7 @@ class _FakeFSService:
             "content": "abc",
         }
 
-    def write(self, **kwargs) -> dict:
+    async def write(self, **kwargs) -> dict:
         self.calls.append(("write", kwargs))
         return {
             "path": kwargs["path"],
@@ -82,7 +79,7 @@ class _FakeSandbox:
         cls.configured = {"base_url": base_url, "timeout": timeout}
 
     @classmethod
-    def create(cls) -> _FakeSandbox:
+    async def create(cls) -> _FakeSandbox:
         cls.create_calls += 1
         cls.last = _FakeSandbox("session-created")
         return cls.last
@@ -94,78 +91,77 @@ class _FakeSandbox:
         return cls.last
 
 
-class _ImmediateThread:
-    def __init__(self, target, daemon: bool = False) -> None:  # type: ignore[no-untyped-def]
-        self._target = target
-        self.daemon = daemon
-
-    def start(self) -> None:
-        self._target()
-
-
 class MCPBridgeTests(unittest.TestCase):
     def setUp(self) -> None:
         _FakeSandbox.create_calls = 0
         _FakeSandbox.connect_calls = []
         _FakeSandbox.last = None
 
-    @mock.patch("agentland.mcp.bridge.Sandbox", _FakeSandbox)
+    @mock.patch("agentland.mcp.bridge.AsyncSandbox", _FakeSandbox)
     def test_sandbox_create(self) -> None:
         bridge = CodeInterpreterToolBridge(base_url="http://127.0.0.1:8080", timeout=30)
-        out = bridge.sandbox_create()
+        out = asyncio.run(bridge.sandbox_create())
         self.assertEqual({"sandbox_id": "session-created"}, out)
         self.assertEqual(1, _FakeSandbox.create_calls)
 
-    @mock.patch("agentland.mcp.bridge.Sandbox", _FakeSandbox)
+    @mock.patch("agentland.mcp.bridge.AsyncSandbox", _FakeSandbox)
     def test_code_execute_and_async_cleanup(self) -> None:
         bridge = CodeInterpreterToolBridge(base_url="http://127.0.0.1:8080", timeout=30)
         cleanup_called = {"ok": False}
 
         def _cleanup(context):  # type: ignore[no-untyped-def]
             cleanup_called["ok"] = True
-            context.delete()
-
-        with mock.patch.object(bridge, "_delete_context_async", side_effect=_cleanup):
-            out = bridge.code_execute(
-                sandbox_id="session-1",
-                code="print(1)",
-                language="python",
-                cwd="/workspace",
-                timeout_ms=20000,
+
+        with mock.patch.object(
+            CodeInterpreterToolBridge, "_delete_context_async", side_effect=_cleanup
+        ):
+            out = asyncio.run(
+                bridge.code_execute(
+                    sandbox_id="session-1",
+                    code="print(1)",
+                    language="python",
+                    cwd="/workspace",
+                    timeout_ms=20000,
+                )
             )
 
         self.assertEqual(0, out["exit_code"])
         self.assertEqual("ctx-1", out["context_id"])
         self.assertTrue(cleanup_called["ok"])
 
-    @mock.patch("agentland.mcp.bridge.Sandbox", _FakeSandbox)
+    @mock.patch("agentland.mcp.bridge.AsyncSandbox", _FakeSandbox)
     def test_fs_tree_optional_depth(self) -> None:
         bridge = CodeInterpreterToolBridge(base_url="http://127.0.0.1:8080", timeout=30)
-        bridge.fs_tree(sandbox_id="session-1", path="", depth=0, includeHidden=True)
+        asyncio.run(bridge.fs_tree(sandbox_id="session-1", path="", depth=0, includeHidden=True))
         method, kwargs = _FakeSandbox.last.fs.calls[-1]
         self.assertEqual("tree", method)
         self.assertEqual(".", kwargs["path"])
         self.assertEqual(True, kwargs["include_hidden"])
         self.assertNotIn("depth", kwargs)
 
-    @mock.patch("agentland.mcp.bridge.Sandbox", _FakeSandbox)
+    @mock.patch("agentland.mcp.bridge.AsyncSandbox", _FakeSandbox)
     def test_missing_sandbox_id(self) -> None:
         bridge = CodeInterpreterToolBridge(base_url="http://127.0.0.1:8080", timeout=30)
         with self.assertRaises(ValueError):
-            bridge.fs_file_get(sandbox_id=" ", path="/workspace/a.txt")
+            asyncio.run(bridge.fs_file_get(sandbox_id=" ", path="/workspace/a.txt"))
 
-    @mock.patch("agentland.mcp.bridge.Thread", _ImmediateThread)
     def test_async_delete_logs_unexpected_error(self) -> None:
         bridge = CodeInterpreterToolBridge(base_url="http://127.0.0.1:8080", timeout=30)
 
         class _BrokenContext:
-            def delete(self) -> None:
+            async def delete(self) -> None:
                 raise RuntimeError("boom")
 
-        stderr = io.StringIO()
-        with mock.patch("agentland.mcp.bridge.sys.stderr", stderr):
-            bridge._delete_context_async(_BrokenContext())
-        self.assertIn("Unexpected error during async context deletion: boom", stderr.getvalue())
+        async def _scenario() -> str:
+            stderr = io.StringIO()
+            with mock.patch("agentland.mcp.bridge.sys.stderr", stderr):
+                bridge._delete_context_async(_BrokenContext())
+                await asyncio.sleep(0)
+                await asyncio.sleep(0)
+            return stderr.getvalue()
+
+        logged = asyncio.run(_scenario())
+        self.assertIn("Unexpected error during async context deletion: boom", logged)
 
 
 if __name__ == "__main__":
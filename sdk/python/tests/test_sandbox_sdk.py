@@ -1,216 +1,222 @@
 from __future__ import annotations
 
-import json
-import os
-import sys
-import tempfile
-import unittest
+from email.parser import BytesParser
+from email.policy import default as email_default
 from pathlib import Path
-from unittest import mock
 
-sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+import orjson
+import pytest
 
 from agentland.sandbox import ExecutionResult, SDKError, Sandbox
 
+BASE_URL = "http://127.0.0.1:8080"
+
+_CREATE_OK = b'{"code":200,"msg":"success","data":{"sandbox_id":"session-1"}}'
+_CTX_CREATE = b'{"context_id":"ctx-1"}'
+_CTX_DELETE = b'{"context_id":"ctx-1"}'
+_UPLOAD_OK = (
+    b'{"code":200,"msg":"success","data":{"source_path":"data.csv",'
+    b'"target_path":"/workspace/data.csv","size":12}}'
+)
+_ERR_FORM = b'{"code":1,"msg":"Form Error"}'
+
+_SSE_BODY = (
+    b'data: {"type":"init","timestamp":1,"context_id":"ctx-1"}\n\n'
+    b'data: {"type":"stdout","timestamp":2,"context_id":"ctx-1","text":"ok\\n"}\n\n'
+    b'data: {"type":"count","timestamp":2,"context_id":"ctx-1","execution_count":1}\n\n'
+    b'data: {"type":"execution_complete","timestamp":3,"context_id":"ctx-1",'
+    b'"execution_time":3,"exit_code":0}\n\n'
+)
+
+
+# One configure per module; only the UDS test switches config and it
+# restores this default before returning.
+@pytest.fixture(scope="module", autouse=True)
+def _configure():
+    Sandbox.configure(base_url=BASE_URL, timeout=5)
+
+
+def test_create_sandbox_success(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/api/code-runner/sandboxes",
+        content=_CREATE_OK,
+    )
+
+    sandbox = Sandbox.create()
+    assert sandbox.sandbox_id == "session-1"
+
+
+def test_connect_does_not_issue_request(httpx_mock) -> None:
+    sandbox = Sandbox.connect("session-existing")
+    assert sandbox.sandbox_id == "session-existing"
+    assert httpx_mock.get_requests() == []
+
+
+def test_context_exec_with_raw_payload(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/api/code-runner/contexts",
+        content=_CTX_CREATE,
+    )
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/api/code-runner/contexts/ctx-1/execute",
+        headers={"Content-Type": "text/event-stream"},
+        content=_SSE_BODY,
+    )
+    httpx_mock.add_response(
+        method="DELETE",
+        url=f"{BASE_URL}/api/code-runner/contexts/ctx-1",
+        content=_CTX_DELETE,
+    )
+
+    sandbox = Sandbox.connect("session-1")
+    ctx = sandbox.context.create(language="python", cwd="/workspace")
+    assert ctx.context_id == "ctx-1"
+    out = ctx.exec("print('ok')", timeout_ms=30000)
+    assert isinstance(out, ExecutionResult)
+    assert out.context_id == "ctx-1"
+    assert out.execution_count == 1
+    assert out.exit_code == 0
+    assert out.stdout == "ok\n"
+    assert out.stderr == ""
+    assert out.duration_ms == 3
+    with pytest.raises(TypeError):
+        _ = out["stdout"]  # type: ignore[index]
+    with pytest.raises(AttributeError):
+        _ = out.get("stdout", "")  # type: ignore[attr-defined]
+
+    exec_request = httpx_mock.get_requests()[1]
+    assert orjson.loads(exec_request.read()) == {
+        "code": "print('ok')",
+        "timeout_ms": 30000,
+    }
+    deleted = ctx.delete()
+    assert deleted["context_id"] == "ctx-1"
+
+
+def test_upload_uses_local_path_and_multipart(httpx_mock, fs) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/api/code-runner/fs/upload",
+        content=_UPLOAD_OK,
+    )
+
+    sandbox = Sandbox.connect("session-1")
+    fs.create_file("/virtual/data.csv", contents="name,value\n")
+    out = sandbox.fs.upload("/virtual/data.csv", "/workspace/data.csv")
+
+    assert out["target_path"] == "/workspace/data.csv"
+    request = httpx_mock.get_requests()[0]
+    content_type = request.headers["Content-Type"]
+    assert content_type.startswith("multipart/form-data; boundary=")
+    # Parse the body once instead of substring-scanning it per assertion.
+    message = BytesParser(policy=email_default).parsebytes(
+        b"Content-Type: " + content_type.encode("utf-8") + b"\r\n\r\n" + request.read()
+    )
+    parts = {
+        part.get_param("name", header="content-disposition"): part
+        for part in message.iter_parts()
+    }
+    assert set(parts) == {"target_file_path", "file"}
+    assert parts["target_file_path"].get_content() == "/workspace/data.csv"
+    file_part = parts["file"]
+    assert file_part.get_filename() == "data.csv"
+    assert file_part.get_content_type() == "text/csv"
+    assert file_part.get_content() == "name,value\n"
+
+
+def test_download_saves_local_file(httpx_mock, fs) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/api/code-runner/fs/download?path=%2Fworkspace%2Fresult.csv",
+        headers={
+            "Content-Disposition": 'attachment; filename="result.csv"',
+            "X-Agentland-File-Path": "/workspace/result.csv",
+        },
+        content=b"id,score\n1,100\n",
+    )
+
+    sandbox = Sandbox.connect("session-1")
+    save_path = "/virtual/nested/result.csv"
+    out = sandbox.fs.download("/workspace/result.csv", save_path)
+
+    assert Path(save_path).read_bytes() == b"id,score\n1,100\n"
+    assert out["source_path"] == "/workspace/result.csv"
+    assert out["file_name"] == "result.csv"
+    assert out["size"] > 0
+
+
+def test_unix_base_url_dispatches_over_uds(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url="http://agentland/api/code-runner/sandboxes",
+        content=_CREATE_OK,
+    )
+
+    Sandbox.configure(base_url="unix:///tmp/agentland.sock", timeout=5)
+    try:
+        sandbox = Sandbox.create()
+        assert sandbox.sandbox_id == "session-1"
+    finally:
+        Sandbox.configure(base_url=BASE_URL, timeout=5)
+
+
+def test_batch_runs_ops_concurrently(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/api/code-runner/fs/file?path=%2Fa",
+        content=orjson.dumps(
+            {"code": 200, "msg": "success", "data": {"echo": "/a"}}
+        ),
+    )
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/api/code-runner/fs/file?path=%2Fb",
+        content=orjson.dumps(
+            {"code": 200, "msg": "success", "data": {"echo": "/b"}}
+        ),
+    )
+
+    sandbox = Sandbox.connect("session-1")
+    out = sandbox.batch(
+        [
+            {"method": "GET", "path": "/api/code-runner/fs/file", "query": {"path": "/a"}},
+            {"method": "GET", "path": "/api/code-runner/fs/file", "query": {"path": "/b"}},
+        ]
+    )
 
-class _FakeResponse:
-    def __init__(self, *, status_code: int, body: bytes, headers: dict[str, str] | None = None):
-        self.status_code = status_code
-        self.content = body
-        self.headers = {} if headers is None else dict(headers)
-        self.text = body.decode("utf-8", errors="replace")
-
-
-class _FakeStreamResponse:
-    def __init__(
-        self,
-        *,
-        status_code: int,
-        lines: list[str],
-        headers: dict[str, str] | None = None,
-        body: bytes = b"",
-    ):
-        self.status_code = status_code
-        self.headers = {} if headers is None else dict(headers)
-        self._lines = list(lines)
-        self._body = body
-
-    def iter_lines(self):  # type: ignore[no-untyped-def]
-        return iter(self._lines)
-
-    def read(self) -> bytes:
-        return self._body
-
+    assert [op["echo"] for op in out] == ["/a", "/b"]
 
-class _FakeStreamContext:
-    def __init__(self, resp: _FakeStreamResponse):
-        self._resp = resp
 
-    def __enter__(self) -> _FakeStreamResponse:
-        return self._resp
+def test_close_keeps_shared_client_usable(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{BASE_URL}/api/code-runner/fs/file?path=%2Fworkspace%2Fa.txt&encoding=utf8",
+        content=orjson.dumps(
+            {"code": 200, "msg": "success", "data": {"path": "/workspace/a.txt"}}
+        ),
+    )
 
-    def __exit__(self, exc_type, exc, tb):  # type: ignore[no-untyped-def]
-        return False
+    first = Sandbox.connect("session-1")
+    second = Sandbox.connect("session-2")
+    first.close()
 
+    out = second.fs.read("/workspace/a.txt")
+    assert out["path"] == "/workspace/a.txt"
+    second.close()
 
-class SandboxSDKTest(unittest.TestCase):
-    def setUp(self) -> None:
-        Sandbox.configure(base_url="http://127.0.0.1:8080", timeout=5)
 
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    def test_create_sandbox_success(self, mock_open: mock.Mock) -> None:
-        mock_open.return_value = _FakeResponse(
-            status_code=200,
-            body=json.dumps(
-                {"code": 200, "msg": "success", "data": {"sandbox_id": "session-1"}}
-            ).encode("utf-8"),
-        )
+def test_http_error_raises_sdk_error(httpx_mock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url=f"{BASE_URL}/api/code-runner/sandboxes",
+        status_code=400,
+        content=_ERR_FORM,
+    )
 
-        sandbox = Sandbox.create()
-        self.assertEqual("session-1", sandbox.sandbox_id)
-
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    def test_connect_does_not_issue_request(self, mock_open: mock.Mock) -> None:
-        sandbox = Sandbox.connect("session-existing")
-        self.assertEqual("session-existing", sandbox.sandbox_id)
-        mock_open.assert_not_called()
-
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    @mock.patch("agentland.sandbox._http.httpx.stream")
-    def test_context_exec_with_raw_payload(self, mock_stream: mock.Mock, mock_open: mock.Mock) -> None:
-        captured_stream_kwargs: dict[str, object] = {}
-
-        def _stream_side_effect(*args, **kwargs):  # type: ignore[no-untyped-def]
-            captured_stream_kwargs.update(kwargs)
-            return _FakeStreamContext(
-                _FakeStreamResponse(
-                    status_code=200,
-                    headers={"Content-Type": "text/event-stream"},
-                    lines=[
-                        "data: {\"type\":\"init\",\"timestamp\":1,\"context_id\":\"ctx-1\"}",
-                        "data: {\"type\":\"stdout\",\"timestamp\":2,\"context_id\":\"ctx-1\",\"text\":\"ok\\n\"}",
-                        "data: {\"type\":\"count\",\"timestamp\":2,\"context_id\":\"ctx-1\",\"execution_count\":1}",
-                        "data: {\"type\":\"execution_complete\",\"timestamp\":3,\"context_id\":\"ctx-1\",\"execution_time\":3,\"exit_code\":0}",
-                    ],
-                )
-            )
-
-        request_responses = [
-            _FakeResponse(
-                status_code=200,
-                body=json.dumps({"context_id": "ctx-1"}).encode("utf-8"),
-            ),
-            _FakeResponse(
-                status_code=200,
-                body=json.dumps({"context_id": "ctx-1"}).encode("utf-8"),
-            ),
-        ]
-        mock_open.side_effect = request_responses
-        mock_stream.side_effect = _stream_side_effect
-
-        sandbox = Sandbox.connect("session-1")
-        ctx = sandbox.context.create(language="python", cwd="/workspace")
-        self.assertEqual("ctx-1", ctx.context_id)
-        out = ctx.exec("print('ok')", timeout_ms=30000)
-        self.assertIsInstance(out, ExecutionResult)
-        self.assertEqual("ctx-1", out.context_id)
-        self.assertEqual(1, out.execution_count)
-        self.assertEqual(0, out.exit_code)
-        self.assertEqual("ok\n", out.stdout)
-        self.assertEqual("", out.stderr)
-        self.assertEqual(3, out.duration_ms)
-        with self.assertRaises(TypeError):
-            _ = out["stdout"]  # type: ignore[index]
-        with self.assertRaises(AttributeError):
-            _ = out.get("stdout", "")  # type: ignore[attr-defined]
-        stream_json = captured_stream_kwargs.get("json")
-        self.assertEqual({"code": "print('ok')", "timeout_ms": 30000}, stream_json)
-        self.assertNotIn("content", captured_stream_kwargs)
-        deleted = ctx.delete()
-        self.assertEqual("ctx-1", deleted["context_id"])
-
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    def test_upload_uses_local_path_and_multipart(self, mock_open: mock.Mock) -> None:
-        captured_request: dict[str, object] = {}
-
-        def _side_effect(method, url, **kwargs):  # type: ignore[no-untyped-def]
-            captured_request["method"] = method
-            captured_request["url"] = url
-            captured_request["kwargs"] = kwargs
-            files = kwargs["files"]
-            file_info = files["file"]
-            captured_request["uploaded_content"] = file_info[1].read().decode("utf-8")
-            return _FakeResponse(
-                status_code=200,
-                body=json.dumps(
-                    {
-                        "code": 200,
-                        "msg": "success",
-                        "data": {
-                            "source_path": "data.csv",
-                            "target_path": "/workspace/data.csv",
-                            "size": 12,
-                        },
-                    }
-                ).encode("utf-8"),
-            )
-
-        mock_open.side_effect = _side_effect
-
-        sandbox = Sandbox.connect("session-1")
-        with tempfile.TemporaryDirectory() as td:
-            local_file = os.path.join(td, "data.csv")
-            Path(local_file).write_text("name,value\n", encoding="utf-8")
-            out = sandbox.fs.upload(local_file, "/workspace/data.csv")
-
-        self.assertEqual("/workspace/data.csv", out["target_path"])
-        self.assertEqual("POST", captured_request["method"])
-        kwargs = captured_request["kwargs"]
-        self.assertIsInstance(kwargs, dict)
-        files = kwargs["files"]
-        self.assertIsInstance(files, dict)
-        self.assertIn("file", files)
-        file_info = files["file"]
-        self.assertEqual("data.csv", file_info[0])
-        self.assertEqual("text/csv", file_info[2])
-        self.assertEqual("name,value\n", captured_request["uploaded_content"])
-        data = kwargs["data"]
-        self.assertEqual("/workspace/data.csv", data["target_file_path"])
-
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    def test_download_saves_local_file(self, mock_open: mock.Mock) -> None:
-        mock_open.return_value = _FakeResponse(
-            status_code=200,
-            body=b"id,score\n1,100\n",
-            headers={
-                "Content-Disposition": 'attachment; filename="result.csv"',
-                "X-Agentland-File-Path": "/workspace/result.csv",
-            },
-        )
-
-        sandbox = Sandbox.connect("session-1")
-        with tempfile.TemporaryDirectory() as td:
-            save_path = os.path.join(td, "nested", "result.csv")
-            out = sandbox.fs.download("/workspace/result.csv", save_path)
-            content = Path(save_path).read_bytes()
-
-        self.assertEqual(b"id,score\n1,100\n", content)
-        self.assertEqual("/workspace/result.csv", out["source_path"])
-        self.assertEqual("result.csv", out["file_name"])
-        self.assertGreater(out["size"], 0)
-
-    @mock.patch("agentland.sandbox._http.httpx.request")
-    def test_http_error_raises_sdk_error(self, mock_open: mock.Mock) -> None:
-        mock_open.return_value = _FakeResponse(
-            status_code=400,
-            body=json.dumps({"code": 1, "msg": "Form Error"}).encode("utf-8"),
-        )
-
-        with self.assertRaises(SDKError) as ctx:
-            Sandbox.create()
-        self.assertEqual(400, ctx.exception.http_status)
-        self.assertEqual(1, ctx.exception.code)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    with pytest.raises(SDKError) as exc_info:
+        Sandbox.create()
+    assert exc_info.value.http_status == 400
+    assert exc_info.value.code == 1